@@ -0,0 +1,26 @@
+"""Optional numba acceleration.
+
+Exposes `njit` and `prange` from numba when it is installed. Without numba,
+`njit` becomes a no-op decorator and `prange` falls back to `range`, so the
+decorated kernels still run as plain Python.
+"""
+
+from __future__ import annotations
+
+try:
+	from numba import njit, prange
+
+	NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+	NUMBA_AVAILABLE = False
+	prange = range
+
+	def njit(*args, **kwargs):
+		"""No-op stand-in for `numba.njit` supporting bare and called forms."""
+		if len(args) == 1 and callable(args[0]) and not kwargs:
+			return args[0]
+
+		def decorator(func):
+			return func
+
+		return decorator
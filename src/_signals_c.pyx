@@ -0,0 +1,61 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Ahead-of-time compiled version of `signals._positions_loop`.
+
+Optional: build in place with `cythonize -i src/_signals_c.pyx`. When the
+extension is not built, `signals` falls back to the numba kernel.
+"""
+
+from libc.math cimport fabs, isnan
+
+
+def positions_loop(
+	const double[::1] z,
+	double z_in,
+	double z_out,
+	double stop,
+	double tp,
+	int tp_enabled,
+	double confirm_delta,
+	signed char[::1] out,
+):
+	"""Run the entry/exit state machine over `z`, writing states into `out`.
+
+	Same rules as `signals._positions_loop`: -1 short spread, 0 flat, +1 long.
+	"""
+	cdef Py_ssize_t i, n = z.shape[0]
+	cdef signed char pos = 0
+	cdef signed char pending_kind = 0
+	cdef double pending_z = 0.0
+	cdef double zi, az
+
+	if out.shape[0] != n:
+		raise ValueError("out must have the same length as z")
+
+	with nogil:
+		for i in range(n):
+			zi = z[i]
+			# NaN bars hold the current state (pos is 0 whenever flat)
+			if not isnan(zi):
+				az = fabs(zi)
+				if pos != 0:
+					# Stop first, then take-profit, then exit
+					if az >= stop or (tp_enabled and az < tp) or az <= z_out:
+						pos = 0
+						pending_kind = 0
+				elif pending_kind == 0:
+					# Watch for threshold cross
+					if zi >= z_in:
+						pending_kind = -1
+						pending_z = zi
+					elif zi <= -z_in:
+						pending_kind = 1
+						pending_z = zi
+				elif (
+					confirm_delta <= 0
+					or (pending_kind == -1 and zi <= max(z_in, pending_z - confirm_delta))
+					or (pending_kind == 1 and zi >= min(-z_in, pending_z + confirm_delta))
+				):
+					# Entry, after reversal toward 0 by confirm_delta if required
+					pos = pending_kind
+					pending_kind = 0
+			out[i] = pos
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
-from .signals import zscore, generate_positions
+from ._njit import njit, prange
+from .signals import _positions, _positions_loop, _zscore_array, _zscore_kernel
 
 
 @dataclass
@@ -18,9 +20,66 @@ class BacktestParams:
 	cost_bps: float = 1.0  # per leg per trade, in basis points
 
 
-def _compute_turnover(weight: pd.Series) -> pd.Series:
-	"""Compute daily turnover as absolute day-over-day change in weight."""
-	return weight.fillna(0.0).diff().abs()
+@njit(cache=True)
+def _pnl_kernel(
+	pxA: np.ndarray,
+	pxB: np.ndarray,
+	y_pos: np.ndarray,
+	x_pos: np.ndarray,
+	cost_rate: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Compute returns, equity and turnover in a single pass.
+
+	Holdings are the previous close positions: qB = y_pos[t-1] and
+	qA = -x_pos[t-1]. Dollar PnL and traded notional are normalized by the
+	prior-day gross exposure; days without exposure have zero return and
+	turnover. Transaction costs are `cost_rate` times the turnover.
+	"""
+	n = pxA.shape[0]
+	ret = np.zeros(n)
+	equity = np.empty(n)
+	turnover = np.zeros(n)
+	eq = 1.0
+	for i in range(n):
+		if i > 0:
+			qB = y_pos[i - 1]
+			qA = -x_pos[i - 1]
+			gross_prev = abs(qB) * pxB[i - 1] + abs(qA) * pxA[i - 1]
+			if gross_prev != 0.0 and not math.isnan(gross_prev):
+				pnl = qB * (pxB[i] - pxB[i - 1]) + qA * (pxA[i] - pxA[i - 1])
+				traded = abs(y_pos[i] - y_pos[i - 1]) * pxB[i] + abs(x_pos[i] - x_pos[i - 1]) * pxA[i]
+				turnover[i] = traded / gross_prev
+				ret[i] = pnl / gross_prev - cost_rate * turnover[i]
+		eq *= 1.0 + ret[i]
+		equity[i] = eq
+	return ret, equity, turnover
+
+
+def _align_prices(pricesA: pd.Series, pricesB: pd.Series) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+	"""Return the common non-NaN dates of two sorted series and their prices.
+
+	For DatetimeIndex inputs of the same dtype the dates are matched on their
+	int64 values with `np.intersect1d`, avoiding Timestamp objects and reindex.
+	"""
+	a = pricesA.to_numpy(dtype=np.float64, na_value=np.nan)
+	b = pricesB.to_numpy(dtype=np.float64, na_value=np.nan)
+	idxA = pricesA.index
+	idxB = pricesB.index
+	if (
+		isinstance(idxA, pd.DatetimeIndex)
+		and idxA.dtype == idxB.dtype
+		and idxA.is_unique
+		and idxB.is_unique
+	):
+		okA = ~np.isnan(a)
+		okB = ~np.isnan(b)
+		_, ia, ib = np.intersect1d(idxA.asi8[okA], idxB.asi8[okB], assume_unique=True, return_indices=True)
+		return idxA[okA][ia], a[okA][ia], b[okB][ib]
+
+	index = pricesA.dropna().index.intersection(pricesB.dropna().index)
+	pxA = pricesA.reindex(index).to_numpy(dtype=np.float64, na_value=np.nan)
+	pxB = pricesB.reindex(index).to_numpy(dtype=np.float64, na_value=np.nan)
+	return index, pxA, pxB
 
 
 def backtest_pair(
@@ -51,48 +110,26 @@ def backtest_pair(
 	pd.DataFrame
 		Columns: ret, equity, z, y_pos, x_pos, turnover.
 	"""
-	index = pd.Index(sorted(pricesA.dropna().index.intersection(pricesB.dropna().index)))
-	pxA = pricesA.reindex(index).astype(float)
-	pxB = pricesB.reindex(index).astype(float)
-
-	spread = pxB - beta * pxA
-	lookback = int(params.get("lookback", 60))
-	z = zscore(spread, lookback=lookback)
-	y_pos, x_pos = generate_positions(
-		z=z,
-		beta=beta,
-		z_in=float(params.get("z_in", 2.0)),
-		z_out=float(params.get("z_out", 0.5)),
-		stop=float(params.get("stop", 3.5)),
+	if not (pricesA.index.is_monotonic_increasing and pricesB.index.is_monotonic_increasing):
+		raise ValueError("price series must have sorted (monotonic increasing) indices")
+	index, pxA, pxB = _align_prices(pricesA, pricesB)
+
+	z = _zscore_array(pxB - beta * pxA, int(params.get("lookback", 60)))
+	state = _positions(
+		z,
+		float(params.get("z_in", 2.0)),
+		float(params.get("z_out", 0.5)),
+		float(params.get("stop", 3.5)),
+		np.nan,
+		0.0,
+		False,
 	)
+	# y leg: +1 long spread, -1 short spread; x leg is beta * y (short in PnL)
+	y_pos = state.astype(np.float64)
+	x_pos = beta * y_pos
 
-	# Share quantities (previous close holdings)
-	qB = y_pos.shift(1).fillna(0.0)
-	# x_pos encodes absolute short notional in units of shares equivalent to beta*y_pos
-	qA = -x_pos.shift(1).fillna(0.0)
-
-	# Price changes
-	dB = pxB.diff().fillna(0.0)
-	dA = pxA.diff().fillna(0.0)
-
-	# Dollar PnL
-	pnl = (qB * dB) + (qA * dA)
-
-	# Prior-day gross exposure (denominator for returns)
-	gross_exposure_prev = (qB.abs() * pxB.shift(1).fillna(method="ffill") + qA.abs() * pxA.shift(1).fillna(method="ffill"))
-	gross_exposure_prev = gross_exposure_prev.replace(0.0, np.nan)
-
-	# Transaction costs on traded notional
 	cost_bps = float(params.get("cost_bps", 1.0))
-	dqB = y_pos.diff().abs().fillna(0.0)
-	dqA = x_pos.diff().abs().fillna(0.0)
-	traded_notional = (dqB * pxB) + (dqA * pxA)
-	cost = (cost_bps / 1e4) * (traded_notional / gross_exposure_prev).fillna(0.0)
-
-	# Returns normalized by prior-day gross exposure
-	gross_ret = (pnl / gross_exposure_prev).fillna(0.0)
-	ret = gross_ret - cost
-	equity = (1.0 + ret).cumprod()
+	ret, equity, turnover = _pnl_kernel(pxA, pxB, y_pos, x_pos, cost_bps / 1e4)
 
 	out = pd.DataFrame(
 		{
@@ -101,7 +138,101 @@ def backtest_pair(
 			"z": z,
 			"y_pos": y_pos,
 			"x_pos": x_pos,
-			"turnover": (traded_notional / gross_exposure_prev).fillna(0.0),
-		}
+			"turnover": turnover,
+		},
+		index=index,
+		copy=False,
 	)
 	return out
+
+
+@njit(cache=True, parallel=True)
+def _batch_kernel(
+	px: np.ndarray,
+	ia: np.ndarray,
+	ib: np.ndarray,
+	betas: np.ndarray,
+	lookback: int,
+	z_in: float,
+	z_out: float,
+	stop: float,
+	cost_rate: float,
+) -> np.ndarray:
+	"""Run `backtest_pair` logic for every pair in parallel.
+
+	`px` is a (time, ticker) price matrix; pair j trades column `ib[j]` against
+	`betas[j]` units of column `ia[j]` on the rows where both prices exist.
+	Returns a (time, pair) matrix of daily returns, NaN outside those rows.
+	"""
+	n_rows = px.shape[0]
+	n_pairs = ia.shape[0]
+	ret = np.full((n_rows, n_pairs), np.nan)
+	for j in prange(n_pairs):
+		colA = px[:, ia[j]]
+		colB = px[:, ib[j]]
+		rows = np.flatnonzero(~np.isnan(colA) & ~np.isnan(colB))
+		pxA = colA[rows]
+		pxB = colB[rows]
+		z = _zscore_kernel(pxB - betas[j] * pxA, lookback)
+		y_pos = _positions_loop(z, z_in, z_out, stop, np.nan, 0.0, False).astype(np.float64)
+		r, _, _ = _pnl_kernel(pxA, pxB, y_pos, betas[j] * y_pos, cost_rate)
+		for k in range(rows.shape[0]):
+			ret[rows[k], j] = r[k]
+	return ret
+
+
+def backtest_pair_batch(
+	prices: pd.DataFrame,
+	pairs: Sequence[Tuple[str, str]],
+	betas: Sequence[float],
+	params: Dict,
+) -> pd.DataFrame:
+	"""Backtest many pairs at once, spreading pairs across CPU cores.
+
+	Each pair (A, B) is evaluated exactly as `backtest_pair(prices[A],
+	prices[B], beta, params)`, with the price matrix shared across pairs.
+
+	Parameters
+	----------
+	prices : pd.DataFrame
+		Price matrix with one column per ticker.
+	pairs : sequence of (str, str)
+		(A, B) ticker pairs; the spread is B - beta * A.
+	betas : sequence of float
+		Hedge ratio for each pair, e.g. from `stats.hedge_ratios_many`.
+	params : dict
+		Parameters dict with keys: lookback, z_in, z_out, stop, cost_bps.
+
+	Returns
+	-------
+	pd.DataFrame
+		Daily returns with one column per pair (MultiIndex of A, B), NaN where
+		either price is missing.
+	"""
+	if not prices.index.is_monotonic_increasing:
+		raise ValueError("price series must have sorted (monotonic increasing) indices")
+	lookback = int(params.get("lookback", 60))
+	if lookback < 1:
+		raise ValueError("lookback must be a positive integer")
+	pairs = [tuple(p) for p in pairs]
+	betas_arr = np.asarray(betas, dtype=np.float64)
+	if betas_arr.shape != (len(pairs),):
+		raise ValueError("betas must contain one hedge ratio per pair")
+	col = {c: i for i, c in enumerate(prices.columns)}
+	missing = sorted({t for p in pairs for t in p} - set(col))
+	if missing:
+		raise KeyError(f"tickers not found in prices: {missing}")
+
+	ret = _batch_kernel(
+		np.ascontiguousarray(prices.to_numpy(dtype=np.float64, na_value=np.nan)),
+		np.array([col[a] for a, _ in pairs], dtype=np.int64),
+		np.array([col[b] for _, b in pairs], dtype=np.int64),
+		betas_arr,
+		lookback,
+		float(params.get("z_in", 2.0)),
+		float(params.get("z_out", 0.5)),
+		float(params.get("stop", 3.5)),
+		float(params.get("cost_bps", 1.0)) / 1e4,
+	)
+	columns = pd.MultiIndex.from_tuples(pairs, names=["A", "B"])
+	return pd.DataFrame(ret, index=prices.index, columns=columns)
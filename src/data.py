@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -12,6 +15,22 @@ import yfinance as yf
 DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "raw"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# Bump to invalidate existing Parquet cache files
+CACHE_VERSION = 1
+
+
+def _cache_key(tickers: List[str], start: str, end: str) -> str:
+	"""Return a short content hash identifying a cache entry.
+
+	The key covers the sorted ticker basket, the date range and
+	`CACHE_VERSION`, so bumping the version invalidates existing files.
+	"""
+	payload = json.dumps(
+		{"tickers": sorted(tickers), "start": start, "end": end, "version": CACHE_VERSION},
+		sort_keys=True,
+	)
+	return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
 
 def _cache_path(tickers: List[str], start: str, end: str) -> Path:
 	"""Return a deterministic cache path for the ticker basket and date range.
@@ -27,9 +46,14 @@ def _cache_path(tickers: List[str], start: str, end: str) -> Path:
 
 	Returns
 	-------
-    Path
-        Path to the cache CSV under `data/raw/`.
+	Path
+		Path to the cache Parquet file under `data/raw/`.
 	"""
+	return DATA_DIR / f"adjclose_{_cache_key(tickers, start, end)}.parquet"
+
+
+def _legacy_cache_path(tickers: List[str], start: str, end: str) -> Path:
+	"""Return the CSV cache path used before the Parquet cache was introduced."""
 	slug = "_".join(sorted([t.replace("/", "-") for t in tickers]))
 	return DATA_DIR / f"adjclose_{slug}_{start}_{end}.csv"
 
@@ -67,13 +91,35 @@ def _clean_price_frame(df: pd.DataFrame) -> pd.DataFrame:
 	return df
 
 
-def get_price_data(tickers: List[str], start: str, end: str) -> pd.DataFrame:
-    """Download daily Adjusted Close prices and cache to `data/raw/`.
+def _apply_dtype_backend(df: pd.DataFrame, dtype_backend: str | None) -> pd.DataFrame:
+	"""Convert price columns to a pandas extension dtype backend.
 
-    This function fetches adjusted close prices for the provided tickers from
-    yfinance, caches them as a CSV in `data/raw/`, and performs light cleaning to
-	handle small gaps. If a cache file matching the request exists, it is loaded
-	to avoid repeated downloads.
+	`None` keeps numpy float64 columns; "pyarrow" or "numpy_nullable" are passed
+	to `DataFrame.convert_dtypes` (pandas >= 2.0). The DatetimeIndex is kept.
+	"""
+	if dtype_backend is None:
+		return df
+	if dtype_backend not in ("pyarrow", "numpy_nullable"):
+		raise ValueError("dtype_backend must be None, 'pyarrow' or 'numpy_nullable'")
+	if int(pd.__version__.split(".")[0]) < 2:
+		raise RuntimeError("dtype_backend requires pandas >= 2.0")
+	return df.convert_dtypes(dtype_backend=dtype_backend)
+
+
+def get_price_data(
+	tickers: List[str],
+	start: str,
+	end: str,
+	dtype_backend: str | None = None,
+) -> pd.DataFrame:
+	"""Download daily Adjusted Close prices and cache to `data/raw/`.
+
+	This function fetches adjusted close prices for the provided tickers from
+	yfinance, caches them as Parquet in `data/raw/`, and performs light cleaning
+	to handle small gaps. If a cache file matching the request exists, it is
+	loaded to avoid repeated downloads; CSV caches written by earlier versions
+	are migrated to Parquet on first use. Loaded frames are also memoized
+	in-process, and each call returns its own copy.
 
 	Parameters
 	----------
@@ -83,6 +129,10 @@ def get_price_data(tickers: List[str], start: str, end: str) -> pd.DataFrame:
 		Start date in YYYY-MM-DD format.
 	end : str
 		End date in YYYY-MM-DD format.
+	dtype_backend : str | None
+		Optional column backend: "pyarrow" returns Arrow-backed columns with
+		native null masks, "numpy_nullable" returns Float64 columns. None
+		(default) returns numpy float64 columns.
 
 	Returns
 	-------
@@ -92,16 +142,42 @@ def get_price_data(tickers: List[str], start: str, end: str) -> pd.DataFrame:
 	if not tickers:
 		raise ValueError("tickers must be a non-empty list")
 	_validate_dates(start, end)
+	prices = _load_prices(tuple(tickers), start, end)
+	if dtype_backend is None:
+		return prices.copy()
+	return _apply_dtype_backend(prices, dtype_backend)
+
+
+def _write_cache(prices: pd.DataFrame, cache_file: Path) -> None:
+	"""Persist prices to the Parquet cache; failures are non-fatal."""
+	try:
+		prices.to_parquet(cache_file, engine="pyarrow", compression="snappy")
+	except Exception:
+		pass
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prices(tickers: Tuple[str, ...], start: str, end: str) -> pd.DataFrame:
+	"""Load prices from the cache or yfinance; memoized per (tickers, start, end)."""
+	tickers = list(tickers)
 	cache_file = _cache_path(tickers, start, end)
 
 	if cache_file.exists():
 		try:
-			df = pd.read_csv(cache_file, index_col=0, parse_dates=True)
-			return _clean_price_frame(df)
+			return pd.read_parquet(cache_file, engine="pyarrow")
 		except Exception:
 			# Fallback to re-download if cache is corrupted
 			pass
 
+	legacy_file = _legacy_cache_path(tickers, start, end)
+	if legacy_file.exists():
+		try:
+			prices = _clean_price_frame(pd.read_csv(legacy_file, index_col=0, parse_dates=True))
+			_write_cache(prices, cache_file)
+			return prices
+		except Exception:
+			pass
+
 	# Download with yfinance
 	data = yf.download(
 		tickers=tickers,
@@ -143,10 +219,6 @@ def get_price_data(tickers: List[str], start: str, end: str) -> pd.DataFrame:
 	prices = prices.reindex(columns=present)
 
 	# Persist cache
-	try:
-		prices.to_csv(cache_file)
-	except Exception:
-		# Non-fatal if cache cannot be written
-		pass
+	_write_cache(prices, cache_file)
 
 	return prices
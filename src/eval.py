@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+from dataclasses import dataclass
 from typing import Dict, Tuple
 
 import numpy as np
@@ -7,35 +9,107 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from ._njit import njit, prange
+
 sns.set_style("whitegrid")
 
 
-def metrics(ret: pd.Series, freq: int = 252) -> dict:
-	"""Compute performance metrics from a return series.
+@dataclass
+class PerfArtifacts:
+	"""Return-derived paths shared by `metrics` and the plotting helpers.
+
+	All arrays are aligned to `index`. NaN returns count as flat days in the
+	cumulative paths; `peak` and `drawdown` are NaN before the first valid
+	return, so drawdowns are measured from the first observed equity value.
+	"""
+
+	index: pd.Index
+	ret: np.ndarray  # raw returns, NaN preserved
+	lr: np.ndarray  # log1p(ret), NaN -> 0, -inf once equity is wiped out
+	cum_lr: np.ndarray  # cumulative log growth
+	equity: np.ndarray  # exp(cum_lr)
+	peak: np.ndarray  # running max of cum_lr
+	drawdown: np.ndarray  # equity / running max equity - 1
+	n_obs: int  # number of non-NaN returns
+
+
+def build_perf_artifacts(ret: pd.Series) -> PerfArtifacts:
+	"""Compute equity and drawdown paths from returns in one cumulative pass.
 
 	Parameters
 	----------
 	ret : pd.Series
 		Daily strategy returns.
+
+	Returns
+	-------
+	PerfArtifacts
+		Log growth, equity, running peak and drawdown aligned to `ret`.
+	"""
+	s = pd.Series(ret)
+	r = s.to_numpy(dtype=np.float64, na_value=np.nan)
+	valid = ~np.isnan(r)
+	# A return <= -1 wipes out the equity: log1p(-1) = -inf keeps cum_lr at
+	# -inf (equity 0) from that bar on, instead of NaN from log1p(r < -1)
+	with np.errstate(divide="ignore"):
+		lr = np.log1p(np.where(valid, np.maximum(r, -1.0), 0.0))
+	cum_lr = np.cumsum(lr)
+	# Running max over valid bars only; leading NaN bars stay NaN
+	first = int(np.argmax(valid)) if valid.any() else r.size
+	peak = np.full(r.size, np.nan)
+	peak[first:] = np.maximum.accumulate(cum_lr[first:])
+	with np.errstate(invalid="ignore"):
+		drawdown = np.expm1(cum_lr - peak)
+	drawdown[np.isneginf(cum_lr)] = -1.0
+	return PerfArtifacts(
+		index=s.index,
+		ret=r,
+		lr=lr,
+		cum_lr=cum_lr,
+		equity=np.exp(cum_lr),
+		peak=peak,
+		drawdown=drawdown,
+		n_obs=int(valid.sum()),
+	)
+
+
+def _resolve_artifacts(ret: pd.Series | None, artifacts: PerfArtifacts | None) -> PerfArtifacts:
+	"""Return `artifacts`, building them from `ret` when not supplied."""
+	if artifacts is not None:
+		return artifacts
+	if ret is None:
+		raise ValueError("either ret or artifacts must be provided")
+	return build_perf_artifacts(ret)
+
+
+def metrics(ret: pd.Series | None = None, freq: int = 252, artifacts: PerfArtifacts | None = None) -> dict:
+	"""Compute performance metrics from a return series.
+
+	Parameters
+	----------
+	ret : pd.Series | None
+		Daily strategy returns. May be omitted when `artifacts` is given.
 	freq : int, default 252
 		Trading days per year for annualization.
+	artifacts : PerfArtifacts | None
+		Precomputed paths from `build_perf_artifacts`, reused instead of
+		recomputing the cumulative growth.
 
 	Returns
 	-------
 	dict
 		Dictionary with annualized return, volatility, Sharpe, and max drawdown.
 	"""
-	r = pd.Series(ret).dropna()
-	if r.empty:
+	art = _resolve_artifacts(ret, artifacts)
+	n = art.n_obs
+	if n == 0:
 		return {"ann_return": 0.0, "ann_vol": 0.0, "sharpe": 0.0, "max_dd": 0.0}
 
-	ann_return = (1 + r).prod() ** (freq / max(len(r), 1)) - 1
-	ann_vol = r.std(ddof=1) * np.sqrt(freq)
+	r = art.ret[~np.isnan(art.ret)]
+	ann_return = np.expm1(art.cum_lr[-1] * freq / n)
+	ann_vol = r.std(ddof=1) * np.sqrt(freq) if n > 1 else np.nan
 	sharpe = 0.0 if ann_vol == 0 else ann_return / ann_vol
-	equity = (1 + r).cumprod()
-	roll_max = equity.cummax()
-	drawdown = equity / roll_max - 1.0
-	max_dd = drawdown.min()
+	max_dd = np.nanmin(art.drawdown)
 
 	return {
 		"ann_return": float(ann_return),
@@ -45,11 +119,93 @@ def metrics(ret: pd.Series, freq: int = 252) -> dict:
 	}
 
 
-def plot_equity_curve(ret: pd.Series, ax: plt.Axes | None = None) -> plt.Axes:
+@njit(cache=True, parallel=True)
+def _bootstrap_sharpe_kernel(r: np.ndarray, block: int, starts: np.ndarray) -> np.ndarray:
+	"""Per-period Sharpe ratio (mean / std) of each block-bootstrap replica.
+
+	Row b of `starts` holds the start offsets of the blocks concatenated to
+	form replica b. Replicas with zero variance yield NaN.
+	"""
+	n_boot, k_blocks = starts.shape
+	m = k_blocks * block
+	out = np.empty(n_boot)
+	for b in prange(n_boot):
+		s = 0.0
+		s2 = 0.0
+		for k in range(k_blocks):
+			st = starts[b, k]
+			for j in range(block):
+				v = r[st + j]
+				s += v
+				s2 += v * v
+		mean = s / m
+		var = (s2 - s * mean) / (m - 1)
+		out[b] = mean / math.sqrt(var) if var > 0.0 else np.nan
+	return out
+
+
+def metrics_bootstrap(
+	ret: pd.Series,
+	block: int = 20,
+	n_boot: int = 10_000,
+	alpha: float = 0.05,
+	freq: int = 252,
+	seed: int | None = None,
+) -> dict:
+	"""Confidence interval for the annualized Sharpe ratio via block bootstrap.
+
+	Resamples the return series as `len(ret) // block` blocks of consecutive
+	days drawn with replacement, which preserves short-range autocorrelation.
+	Sharpe here is the arithmetic mean / std * sqrt(freq), which differs from
+	`metrics()["sharpe"]` (annualized geometric return / volatility); hence
+	the `sharpe_arith` key.
+
+	Parameters
+	----------
+	ret : pd.Series
+		Daily strategy returns.
+	block : int, default 20
+		Block length in days.
+	n_boot : int, default 10000
+		Number of bootstrap replicas.
+	alpha : float, default 0.05
+		Two-sided significance level; the interval covers 1 - alpha.
+	freq : int, default 252
+		Trading days per year for annualization.
+	seed : int | None
+		Seed for the block-start random generator.
+
+	Returns
+	-------
+	dict
+		Dictionary with the sample arithmetic Sharpe (`sharpe_arith`) and the
+		lower/upper interval bounds (`ci_lower`, `ci_upper`).
+	"""
+	r = pd.Series(ret).to_numpy(dtype=np.float64, na_value=np.nan)
+	r = r[~np.isnan(r)]
+	n = r.size
+	if block < 1 or n < max(block, 2):
+		raise ValueError("Return series must contain at least `block` (and 2) observations")
+
+	rng = np.random.default_rng(seed)
+	starts = rng.integers(0, n - block + 1, size=(n_boot, max(n // block, 1)), dtype=np.int64)
+	samples = _bootstrap_sharpe_kernel(r, int(block), starts) * np.sqrt(freq)
+
+	sd = r.std(ddof=1)
+	sharpe = 0.0 if sd == 0 else r.mean() / sd * np.sqrt(freq)
+	lo, hi = np.nanquantile(samples, [alpha / 2, 1 - alpha / 2])
+	return {"sharpe_arith": float(sharpe), "ci_lower": float(lo), "ci_upper": float(hi)}
+
+
+def plot_equity_curve(
+	ret: pd.Series | None = None,
+	ax: plt.Axes | None = None,
+	artifacts: PerfArtifacts | None = None,
+) -> plt.Axes:
 	"""Plot equity curve with proper labels and grid."""
-	eq = (1 + pd.Series(ret).fillna(0)).cumprod()
+	art = _resolve_artifacts(ret, artifacts)
 	ax = ax or plt.gca()
-	ax.plot(eq.index, eq.values, color="#1f77b4", linewidth=2, label="Equity")
+	ax.plot(art.index, art.equity, color="#1f77b4", linewidth=2, label="Equity")
 	ax.set_title("Equity Curve", fontsize=12)
 	ax.set_xlabel("Date")
 	ax.set_ylabel("Cumulative Growth (×)")
@@ -57,13 +213,15 @@ def plot_equity_curve(ret: pd.Series, ax: plt.Axes | None = None) -> plt.Axes:
 	return ax
 
 
-def plot_drawdowns(ret: pd.Series, ax: plt.Axes | None = None) -> plt.Axes:
+def plot_drawdowns(
+	ret: pd.Series | None = None,
+	ax: plt.Axes | None = None,
+	artifacts: PerfArtifacts | None = None,
+) -> plt.Axes:
 	"""Plot drawdowns over time."""
-	eq = (1 + pd.Series(ret).fillna(0)).cumprod()
-	roll_max = eq.cummax()
-	dd = eq / roll_max - 1.0
+	art = _resolve_artifacts(ret, artifacts)
 	ax = ax or plt.gca()
-	ax.fill_between(dd.index, dd.values, 0, color="#d62728", alpha=0.3, label="Drawdown")
+	ax.fill_between(art.index, art.drawdown, 0, color="#d62728", alpha=0.3, label="Drawdown")
 	ax.set_title("Drawdowns", fontsize=12)
 	ax.set_xlabel("Date")
 	ax.set_ylabel("Drawdown")
@@ -71,9 +229,15 @@ def plot_drawdowns(ret: pd.Series, ax: plt.Axes | None = None) -> plt.Axes:
 	return ax
 
 
-def plot_rolling_sharpe(ret: pd.Series, window: int = 126, ax: plt.Axes | None = None) -> plt.Axes:
+def plot_rolling_sharpe(
+	ret: pd.Series | None = None,
+	window: int = 126,
+	ax: plt.Axes | None = None,
+	artifacts: PerfArtifacts | None = None,
+) -> plt.Axes:
 	"""Plot rolling Sharpe ratio (annualized)."""
-	r = pd.Series(ret).fillna(0)
+	art = _resolve_artifacts(ret, artifacts)
+	r = pd.Series(np.nan_to_num(art.ret, nan=0.0), index=art.index)
 	roll_mean = r.rolling(window).mean()
 	roll_std = r.rolling(window).std(ddof=1)
 	roll_sharpe = np.where(roll_std == 0, np.nan, (roll_mean / roll_std) * np.sqrt(252))
@@ -110,11 +274,11 @@ def plot_zscore_with_trades(
 	ax.axhline(stop, color="#d62728", linestyle="-.", linewidth=1, label="stop")
 	ax.axhline(-stop, color="#d62728", linestyle="-.", linewidth=1)
 
-	# Transitions
-	pos_change = y_pos.fillna(0).diff().fillna(0)
-	entries = pos_change != 0
-	for t, val in z[entries].items():
-		ax.scatter(t, val, s=24, color="#9467bd", marker="o", zorder=5)
+	# Transitions, with y_pos aligned to z by label before the positional masks
+	pos_change = y_pos.reindex(z.index).fillna(0).diff().fillna(0)
+	entries = pos_change.to_numpy() != 0
+	z_vals = z.to_numpy(dtype=np.float64, na_value=np.nan)
+	ax.scatter(z.index[entries], z_vals[entries], s=24, color="#9467bd", marker="o", zorder=5)
 
 	ax.set_title("Z-score with Trades", fontsize=12)
 	ax.set_xlabel("Date")
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import math
 from typing import Tuple
 
 import numpy as np
 import pandas as pd
 
+from ._njit import NUMBA_AVAILABLE, njit
 
-def zscore(spread: pd.Series, lookback: int) -> pd.Series:
+try:
+	from ._signals_c import positions_loop as _positions_loop_c
+except ImportError:
+	_positions_loop_c = None
+
+
+def zscore(spread: pd.Series, lookback: int, dtype: np.dtype | type = np.float64) -> pd.Series:
 	"""Compute rolling z-score of a spread.
 
 	z_t = (S_t - mean_{t-L+1..t}(S)) / std_{t-L+1..t}(S)
@@ -17,17 +25,266 @@ def zscore(spread: pd.Series, lookback: int) -> pd.Series:
 		Spread series (e.g., y - beta * x).
 	lookback : int
 		Rolling window length for mean and std.
+	dtype : numpy dtype, default np.float64
+		Floating dtype of the input copy and of the result. np.float32 halves
+		memory traffic; window sums are always accumulated in float64.
 
 	Returns
 	-------
 	pd.Series
 		Rolling z-score with NaNs for the warm-up period.
 	"""
-	s = pd.Series(spread).astype(float)
-	mu = s.rolling(lookback, min_periods=lookback).mean()
-	sigma = s.rolling(lookback, min_periods=lookback).std(ddof=1)
-	z = (s - mu) / sigma
-	return z
+	s = pd.Series(spread)
+	return pd.Series(_zscore_array(s.to_numpy(dtype=dtype, na_value=np.nan), lookback), index=s.index)
+
+
+def _zscore_array(a: np.ndarray, lookback: int) -> np.ndarray:
+	"""Array core of `zscore`; the result has the dtype of `a`."""
+	L = int(lookback)
+	if L < 1:
+		raise ValueError("lookback must be a positive integer")
+	n = a.size
+	out = np.full(n, np.nan, dtype=a.dtype)
+	if L < 2 or n < L:
+		return out
+	if NUMBA_AVAILABLE and a.dtype == np.float64:
+		return _zscore_kernel(a, L)
+
+	# Windowed sums from cumulative sums: O(N) regardless of lookback. Values
+	# are centred first (variance is shift-invariant) to limit cancellation
+	# in the sum-of-squares identity; windows touching a NaN stay NaN, as do
+	# constant windows (zero std in pandas), which would otherwise keep
+	# rounding residue from the sums.
+	nan_mask = np.isnan(a)
+	ref = a[~nan_mask].mean() if not nan_mask.all() else 0.0
+	x = np.where(nan_mask, a.dtype.type(0), a - a.dtype.type(ref))
+	c1 = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+	c2 = np.concatenate(([0.0], np.cumsum(np.square(x, dtype=np.float64))))
+	cnan = np.concatenate(([0], np.cumsum(nan_mask)))
+	cchg = np.concatenate(([0, 1], np.cumsum(a[1:] != a[:-1])))
+
+	sum_w = c1[L:] - c1[:-L]
+	sumsq_w = c2[L:] - c2[:-L]
+	mu = sum_w / L
+	var = (sumsq_w - sum_w * mu) / (L - 1)
+	sigma = np.sqrt(np.maximum(var, 0.0))
+	with np.errstate(divide="ignore", invalid="ignore"):
+		z = (x[L - 1:] - mu) / sigma
+	constant = (cchg[L:] - cchg[1:n - L + 2]) == 0
+	z[((cnan[L:] - cnan[:-L]) > 0) | constant | (sigma == 0)] = np.nan
+	out[L - 1:] = z
+	return out
+
+
+@njit(cache=True)
+def _zscore_kernel(a: np.ndarray, lookback: int) -> np.ndarray:
+	"""Rolling z-score of a float64 array.
+
+	Running-sum form of the windowed recurrence in `_zscore_array`; windows
+	containing a NaN or holding a single repeated value are NaN. Also called
+	from other numba kernels.
+	"""
+	n = a.shape[0]
+	out = np.full(n, np.nan)
+	L = lookback
+	if L < 2 or n < L:
+		return out
+
+	ref = 0.0
+	count = 0
+	for i in range(n):
+		if not math.isnan(a[i]):
+			ref += a[i]
+			count += 1
+	if count > 0:
+		ref /= count
+
+	s1 = 0.0
+	s2 = 0.0
+	n_nan = 0
+	run = 0  # length of the run of equal values ending at i
+	for i in range(n):
+		if math.isnan(a[i]):
+			n_nan += 1
+		else:
+			x = a[i] - ref
+			s1 += x
+			s2 += x * x
+		run = run + 1 if i > 0 and a[i] == a[i - 1] else 1
+		if i >= L:
+			if math.isnan(a[i - L]):
+				n_nan -= 1
+			else:
+				x = a[i - L] - ref
+				s1 -= x
+				s2 -= x * x
+		# A constant window has zero variance (NaN z, as in pandas); the
+		# running sums would leave rounding residue instead
+		if i >= L - 1 and n_nan == 0 and run < L:
+			mu = s1 / L
+			sigma = math.sqrt(max((s2 - s1 * mu) / (L - 1), 0.0))
+			if sigma > 0.0:
+				out[i] = (a[i] - ref - mu) / sigma
+	return out
+
+
+@njit(cache=True)
+def _positions_loop(
+	z_arr: np.ndarray,
+	z_in: float,
+	z_out: float,
+	stop: float,
+	tp_threshold: float,
+	confirm_delta: float,
+	tp_enabled: bool,
+) -> np.ndarray:
+	"""Run the entry/exit state machine over a z-score array.
+
+	Returns an int8 array with -1 (short spread), 0 (flat) or +1 (long spread).
+	A pending entry is tracked as `pending_kind` (-1 short, +1 long, 0 none) and
+	the z-score at the threshold cross `pending_z`.
+	"""
+	n = z_arr.shape[0]
+	state = np.zeros(n, dtype=np.int8)
+	pending_kind = 0
+	pending_z = 0.0
+
+	in_pos = False
+	pos = 0
+	for i in range(n):
+		zi = z_arr[i]
+		if math.isnan(zi):
+			state[i] = pos if in_pos else 0
+			continue
+
+		if in_pos:
+			# Stop first, then take-profit, then exit
+			if (
+				abs(zi) >= stop
+				or (tp_enabled and abs(zi) < tp_threshold)
+				or abs(zi) <= z_out
+			):
+				in_pos = False
+				pos = 0
+				pending_kind = 0
+				state[i] = 0
+				continue
+			# Maintain
+			state[i] = pos
+			continue
+
+		# Flat logic
+		if pending_kind == 0:
+			# Watch for threshold cross
+			if zi >= z_in:
+				pending_kind = -1
+				pending_z = zi
+			elif zi <= -z_in:
+				pending_kind = 1
+				pending_z = zi
+			state[i] = 0
+			continue
+
+		# Confirmation: require reversal toward 0 by confirm_delta
+		if confirm_delta <= 0:
+			# immediate entry on cross
+			enter = True
+		elif pending_kind == -1:
+			# need zi <= z_cross - confirm_delta (move toward 0 from positive side)
+			enter = zi <= max(z_in, pending_z - confirm_delta)
+		else:
+			# need zi >= z_cross + confirm_delta (move toward 0 from negative side)
+			enter = zi >= min(-z_in, pending_z + confirm_delta)
+		if enter:
+			in_pos = True
+			pos = pending_kind
+			pending_kind = 0
+			state[i] = pos
+		else:
+			# Still pending
+			state[i] = 0
+
+	return state
+
+
+def _positions_simple(z_arr: np.ndarray, z_in: float, z_out: float, stop: float) -> np.ndarray:
+	"""Vectorized `_positions_loop` for confirm_delta <= 0 and no take-profit.
+
+	Under these rules a trade enters on the first non-NaN bar after a threshold
+	cross while flat and exits on the first later bar with |z| <= z_out or
+	|z| >= stop. Cross and exit bars are found with array searches, leaving a
+	scalar walk with one step per trade rather than per bar.
+	"""
+	n = z_arr.shape[0]
+	valid = np.flatnonzero(~np.isnan(z_arr))
+	zv = z_arr[valid]
+	m = zv.size
+	abs_z = np.abs(zv)
+	crosses = np.flatnonzero((zv >= z_in) | (zv <= -z_in))
+	exits = np.flatnonzero((abs_z >= stop) | (abs_z <= z_out))
+
+	# For each cross, the first exit at least two bars later (the entry bar is
+	# never an exit); for each exit, the first cross after it.
+	exit_after = np.searchsorted(exits, crosses + 2)
+	cross_after = np.searchsorted(crosses, exits + 1)
+
+	# Walk cross -> exit -> next cross; a cross on the last bar never enters
+	cross_l = crosses.tolist()
+	exit_after_l = exit_after.tolist()
+	cross_after_l = cross_after.tolist()
+	taken = []
+	c = 0
+	while c < crosses.size and cross_l[c] < m - 1:
+		taken.append(c)
+		e = exit_after_l[c]
+		if e == exits.size:
+			break
+		c = cross_after_l[e]
+
+	# Paint each trade [entry, exit) as +pos/-pos steps and integrate
+	taken = np.asarray(taken, dtype=np.int64)
+	cross_bars = crosses[taken]
+	exit_bars = np.append(exits, m)[exit_after[taken]]
+	pos = np.where(zv[cross_bars] >= z_in, -1, 1)
+	valid_ext = np.append(valid, n)
+	steps = np.zeros(n + 1, dtype=np.int64)
+	steps[valid_ext[cross_bars + 1]] += pos
+	steps[valid_ext[exit_bars]] -= pos
+	return np.cumsum(steps[:n]).astype(np.int8)
+
+
+def _positions(
+	z_arr: np.ndarray,
+	z_in: float,
+	z_out: float,
+	stop: float,
+	tp_threshold: float,
+	confirm_delta: float,
+	tp_enabled: bool,
+) -> np.ndarray:
+	"""Run the position state machine, preferring the compiled extension.
+
+	Uses `_signals_c.positions_loop` when it has been built (no JIT warm-up),
+	otherwise the numba `_positions_loop` kernel. Without numba, the default
+	rules (no confirmation, no take-profit) go through `_positions_simple`
+	rather than the interpreted loop.
+	"""
+	if _positions_loop_c is None:
+		if not NUMBA_AVAILABLE and confirm_delta <= 0 and not tp_enabled:
+			return _positions_simple(z_arr, z_in, z_out, stop)
+		return _positions_loop(z_arr, z_in, z_out, stop, tp_threshold, confirm_delta, tp_enabled)
+	state = np.empty(z_arr.shape[0], dtype=np.int8)
+	_positions_loop_c(
+		np.ascontiguousarray(z_arr, dtype=np.float64),
+		z_in,
+		z_out,
+		stop,
+		tp_threshold,
+		int(tp_enabled),
+		confirm_delta,
+		state,
+	)
+	return state
 
 
 def generate_positions(
@@ -78,95 +335,20 @@ def generate_positions(
 		(y_position, x_position) series with values in {-1, 0, 1} scaled as
 		dollar-neutral via beta on x leg.
 	"""
-	z = pd.Series(z).copy()
-	abs_z = z.abs()
-
-	# State machine: -1 short spread, 0 flat, +1 long spread
-	state = np.zeros(len(z), dtype=int)
-	pending_entry = None  # None or ('short'|'long', z_at_cross)
-
-	in_pos = False
-	pos = 0
-	for i in range(len(z)):
-		zi = z.iat[i]
-		if np.isnan(zi):
-			state[i] = 0 if not in_pos else pos
-			continue
-
-		if in_pos:
-			# Stop first
-			if abs(zi) >= stop:
-				in_pos = False
-				pos = 0
-				pending_entry = None
-				state[i] = 0
-				continue
-			# Take-profit
-			if tp_threshold is not None and abs(zi) < tp_threshold:
-				in_pos = False
-				pos = 0
-				pending_entry = None
-				state[i] = 0
-				continue
-			# Exit
-			if abs(zi) <= z_out:
-				in_pos = False
-				pos = 0
-				pending_entry = None
-				state[i] = 0
-				continue
-			# Maintain
-			state[i] = pos
-			continue
-
-		# Flat logic
-		if pending_entry is None:
-			# Watch for threshold cross
-			if zi >= z_in:
-				pending_entry = ("short", zi)
-				state[i] = 0
-				continue
-			elif zi <= -z_in:
-				pending_entry = ("long", zi)
-				state[i] = 0
-				continue
-			else:
-				state[i] = 0
-				continue
-		else:
-			# Confirmation: require reversal toward 0 by confirm_delta
-			kind, z_cross = pending_entry
-			if confirm_delta <= 0:
-				# immediate entry on cross
-				in_pos = True
-				pos = -1 if kind == "short" else 1
-				pending_entry = None
-				state[i] = pos
-				continue
-			else:
-				if kind == "short":
-					# need zi <= z_cross - confirm_delta (move toward 0 from positive side)
-					if zi <= max(z_in, z_cross - confirm_delta):
-						in_pos = True
-						pos = -1
-						pending_entry = None
-						state[i] = pos
-						continue
-				elif kind == "long":
-					# need zi >= z_cross + confirm_delta (move toward 0 from negative side)
-					if zi >= min(-z_in, z_cross + confirm_delta):
-						in_pos = True
-						pos = 1
-						pending_entry = None
-						state[i] = pos
-						continue
-				# Still pending
-				state[i] = 0
-				continue
+	z = pd.Series(z)
+	tp_enabled = tp_threshold is not None
+	state = _positions(
+		z.to_numpy(dtype=np.float64, na_value=np.nan),
+		float(z_in),
+		float(z_out),
+		float(stop),
+		float(tp_threshold) if tp_enabled else np.nan,
+		float(confirm_delta),
+		tp_enabled,
+	)
 
-	state_series = pd.Series(state, index=z.index)
 	# y position: +1 for long spread, -1 for short spread
-	y_pos = state_series.astype(float)
+	y_pos = pd.Series(state.astype(np.float64), index=z.index)
 	# x position: scaled by +beta and interpreted as a short exposure in PnL
 	x_pos = beta * y_pos
 	return y_pos, x_pos
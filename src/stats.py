@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from typing import Tuple
+import functools
+import hashlib
+from typing import Sequence, Tuple
 
 import numpy as np
 import pandas as pd
-from statsmodels.regression.linear_model import OLS
-from statsmodels.tools.tools import add_constant
+import statsmodels
+from joblib import Memory, Parallel, delayed
 from statsmodels.tsa.stattools import adfuller
 
+from .data import DATA_DIR
+
+# On-disk memoization of expensive statistics, persisted across runs
+_memory = Memory(location=str(DATA_DIR / "stats_cache"), verbose=0)
+
 
 def hedge_ratio(y: pd.Series, x: pd.Series) -> float:
 	"""Estimate the static hedge ratio (beta) of y on x using OLS without intercept.
@@ -29,31 +36,136 @@ def hedge_ratio(y: pd.Series, x: pd.Series) -> float:
 	aligned = pd.concat([y, x], axis=1, join="inner").dropna()
 	if aligned.shape[0] < 2:
 		raise ValueError("Not enough overlapping observations to estimate hedge ratio")
-	# No intercept: regress y on x directly
-	model = OLS(aligned.iloc[:, 0].values, aligned.iloc[:, 1].values)
-	result = model.fit()
-	beta = float(result.params[0])
+	# No intercept: closed-form least squares beta = (x . y) / (x . x)
+	y_arr = aligned.iloc[:, 0].to_numpy(dtype=np.float64, na_value=np.nan)
+	x_arr = aligned.iloc[:, 1].to_numpy(dtype=np.float64, na_value=np.nan)
+	xx = np.dot(x_arr, x_arr)
+	if xx == 0.0:
+		raise ValueError("Independent series is identically zero; hedge ratio undefined")
+	beta = float(np.dot(x_arr, y_arr) / xx)
 	return beta
 
 
-def adf_pvalue(series: pd.Series) -> float:
+def hedge_ratios_many(
+	prices: pd.DataFrame,
+	pairs: Sequence[Tuple[str, str]],
+	n_jobs: int = -1,
+) -> np.ndarray:
+	"""Estimate hedge ratios for many (A, B) pairs in parallel.
+
+	For each pair, beta is `hedge_ratio(prices[B], prices[A])`, matching the
+	spread B - beta * A used by `backtest.backtest_pair`.
+
+	Parameters
+	----------
+	prices : pd.DataFrame
+		Price matrix with one column per ticker.
+	pairs : sequence of (str, str)
+		(A, B) ticker pairs.
+	n_jobs : int, default -1
+		Number of parallel workers; -1 uses all cores.
+
+	Returns
+	-------
+	np.ndarray
+		Hedge ratios, one per pair.
+	"""
+	betas = Parallel(n_jobs=n_jobs, prefer="threads")(
+		delayed(hedge_ratio)(prices[b], prices[a]) for a, b in pairs
+	)
+	return np.asarray(betas, dtype=np.float64)
+
+
+class _HashedArray:
+	"""Array wrapper hashed by a digest of its bytes, usable as an lru_cache key."""
+
+	__slots__ = ("arr", "digest")
+
+	def __init__(self, arr: np.ndarray) -> None:
+		self.arr = arr
+		self.digest = hashlib.blake2b(arr.tobytes(), digest_size=16).hexdigest()
+
+	def __hash__(self) -> int:
+		return hash(self.digest)
+
+	def __eq__(self, other: object) -> bool:
+		return isinstance(other, _HashedArray) and self.digest == other.digest
+
+
+def _adf_input(series: pd.Series) -> _HashedArray:
+	"""Validate and convert a series into a hashed float64 array for the ADF test."""
+	arr = np.ascontiguousarray(pd.Series(series).dropna().to_numpy(dtype=np.float64, na_value=np.nan))
+	if arr.size < 10:
+		raise ValueError("Series too short for ADF test (need >= 10 observations)")
+	return _HashedArray(arr)
+
+
+@_memory.cache(ignore=["arr"])
+def _adf_pvalue_disk(
+	key: str,
+	arr: np.ndarray,
+	maxlag: int | None,
+	autolag: str | None,
+	sm_version: str,
+) -> float:
+	"""Disk-memoized `adfuller` p-value; `key` is the content digest of `arr`.
+
+	Passing the digest explicitly spares joblib from hashing the array again.
+	`sm_version` is the statsmodels version, so results cached under another
+	release are not reused.
+	"""
+	res = adfuller(arr, maxlag=maxlag, autolag=autolag)
+	return float(res[1])
+
+
+@functools.lru_cache(maxsize=256)
+def _adf_pvalue_cached(arr: _HashedArray, maxlag: int | None, autolag: str | None) -> float:
+	"""In-process memo over `_adf_pvalue_disk` per (array contents, maxlag, autolag)."""
+	return _adf_pvalue_disk(arr.digest, arr.arr, maxlag, autolag, statsmodels.__version__)
+
+
+def adf_pvalue(series: pd.Series, maxlag: int | None = None) -> float:
 	"""Return the ADF test p-value for the null of a unit root.
 
+	Lag order is selected by AIC up to `maxlag`. Results are memoized on the
+	contents of the series, in-process and on disk under `data/raw/stats_cache/`,
+	so repeated tests of the same spread are free across runs.
+
 	Parameters
 	----------
 	series : pd.Series
 		Input time series.
+	maxlag : int | None
+		Maximum lag considered by the AIC search. If None, statsmodels uses
+		12 * (nobs / 100) ** (1 / 4).
 
 	Returns
 	-------
 	float
 		ADF test p-value.
 	"""
-	arr = pd.Series(series).dropna().values
-	if arr.size < 10:
-		raise ValueError("Series too short for ADF test (need >= 10 observations)")
-	res = adfuller(arr, autolag="AIC")
-	return float(res[1])
+	return _adf_pvalue_cached(_adf_input(series), maxlag, "AIC")
+
+
+def adf_pvalue_fast(series: pd.Series, maxlag: int = 1) -> float:
+	"""Return the ADF test p-value using a fixed lag order.
+
+	Skips the AIC lag search of `adf_pvalue`, which fits one regression per
+	candidate lag. Intended for screening many candidate pairs.
+
+	Parameters
+	----------
+	series : pd.Series
+		Input time series.
+	maxlag : int, default 1
+		Number of lagged differences included in the test regression.
+
+	Returns
+	-------
+	float
+		ADF test p-value.
+	"""
+	return _adf_pvalue_cached(_adf_input(series), int(maxlag), None)
 
 
 def half_life(spread: pd.Series) -> float:
@@ -77,15 +189,17 @@ def half_life(spread: pd.Series) -> float:
 	s = pd.Series(spread).dropna()
 	if s.size < 20:
 		raise ValueError("Spread too short to estimate half-life (need >= 20 observations)")
-	ds = s.diff().dropna()
-	lag_s = s.shift(1).dropna()
-	aligned = pd.concat([ds, lag_s], axis=1, join="inner").dropna()
-	if aligned.empty:
+	arr = s.to_numpy(dtype=np.float64, na_value=np.nan)
+	# Regress ds on lagged s, with intercept (closed-form simple regression slope)
+	x = arr[:-1]
+	y = np.diff(arr)
+	n = x.size
+	sx = x.sum()
+	sy = y.sum()
+	denom = n * np.dot(x, x) - sx * sx
+	if denom <= 0.0:
 		return float("inf")
-	# Regress ds on lagged s, with intercept
-	X = add_constant(aligned.iloc[:, 1].values)
-	Y = aligned.iloc[:, 0].values
-	phi = OLS(Y, X).fit().params[1]
+	phi = (n * np.dot(x, y) - sx * sy) / denom
 	# Map to OU speed of reversion
 	kappa = -np.log1p(phi)
 	if kappa <= 0:
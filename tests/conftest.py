@@ -1,7 +1,10 @@
 import importlib.util
 
+import pandas as pd
 import pytest
 
+from src.data import get_price_data
+
 
 def pytest_configure(config: pytest.Config) -> None:
 	# Register custom markers
@@ -22,3 +25,13 @@ def internet_and_yfinance() -> bool:
 	except Exception:
 		pytest.skip("No internet connectivity; skipping integration test")
 	return True
+
+
+@pytest.fixture(scope="session")
+def ko_pep_prices() -> pd.DataFrame:
+	"""KO/PEP adjusted closes for 2018-01-01..2025-01-01, loaded once per session.
+
+	Served from the `data/raw/` cache when present, so repeated tests share a
+	single load. Tests must not mutate the returned frame.
+	"""
+	return get_price_data(["KO", "PEP"], start="2018-01-01", end="2025-01-01")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import backtest_pair, backtest_pair_batch
+from src.stats import hedge_ratios_many
+
+
+def test_batch_matches_single_pair_backtests() -> None:
+	rng = np.random.default_rng(11)
+	n = 800
+	index = pd.date_range("2019-01-01", periods=n, freq="B")
+	x = 50 * np.exp(np.cumsum(0.01 * rng.standard_normal(n)))
+	prices = pd.DataFrame(
+		{
+			"A": x,
+			"B": 2.0 * x + rng.standard_normal(n),
+			"C": 0.5 * x + rng.standard_normal(n),
+		},
+		index=index,
+	)
+	prices.iloc[:25, 2] = np.nan
+	pairs = [("A", "B"), ("A", "C"), ("C", "B")]
+	params = {"lookback": 40, "z_in": 1.5, "z_out": 0.3, "stop": 3.5, "cost_bps": 1.0}
+
+	betas = hedge_ratios_many(prices, pairs, n_jobs=2)
+	res = backtest_pair_batch(prices, pairs, betas, params)
+
+	assert list(res.columns) == pairs
+	for (a, b), beta in zip(pairs, betas):
+		single = backtest_pair(prices[a], prices[b], beta, params)["ret"]
+		pd.testing.assert_series_equal(
+			res[(a, b)].dropna(), single, check_names=False, check_freq=False, rtol=1e-9
+		)
+
+
+def test_batch_validates_like_single_pair() -> None:
+	index = pd.date_range("2020-01-01", periods=50, freq="B")
+	prices = pd.DataFrame({"A": np.linspace(10, 20, 50), "B": np.linspace(20, 30, 50)}, index=index)
+
+	with pytest.raises(ValueError, match="monotonic"):
+		backtest_pair_batch(prices.iloc[::-1], [("A", "B")], [1.0], {"lookback": 10})
+	with pytest.raises(ValueError, match="lookback"):
+		backtest_pair_batch(prices, [("A", "B")], [1.0], {"lookback": 0})
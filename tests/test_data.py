@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.data as data
+from src.data import get_price_data
+
+
+@pytest.fixture
+def tmp_data_dir(tmp_path, monkeypatch):
+	monkeypatch.setattr(data, "DATA_DIR", tmp_path)
+
+	def no_download(*args, **kwargs):
+		raise AssertionError("unexpected yfinance download")
+
+	monkeypatch.setattr(data.yf, "download", no_download)
+	data._load_prices.cache_clear()
+	yield tmp_path
+	data._load_prices.cache_clear()
+
+
+def test_legacy_csv_migrates_to_parquet_cache(tmp_data_dir) -> None:
+	tickers, start, end = ["PEP", "KO"], "2020-01-01", "2020-03-01"
+	index = pd.date_range("2020-01-02", periods=40, freq="B", name="Date")
+	rng = np.random.default_rng(4)
+	frame = pd.DataFrame({"KO": 50 + rng.random(40), "PEP": 130 + rng.random(40)}, index=index)
+	frame.to_csv(data._legacy_cache_path(tickers, start, end))
+
+	first = get_price_data(tickers, start, end)
+	cache_file = data._cache_path(tickers, start, end)
+	assert cache_file.name == f"adjclose_{data._cache_key(tickers, start, end)}.parquet"
+	assert cache_file.exists()
+
+	# Reload from Parquet, bypassing the in-process memo
+	data._load_prices.cache_clear()
+	second = get_price_data(tickers, start, end)
+	pd.testing.assert_frame_equal(first, second)
+	assert second.index.dtype == np.dtype("datetime64[ns]")
+	assert second.index.name == "Date"
+
+	# Ticker order does not change the cache entry
+	assert data._cache_path(list(reversed(tickers)), start, end) == cache_file
+	get_price_data(list(reversed(tickers)), start, end)
+	assert sorted(p.name for p in tmp_data_dir.glob("*.parquet")) == [cache_file.name]
+
+	# Returned frames are independent of the memoized copy
+	second.iloc[0, 0] = -1.0
+	second["extra"] = 0.0
+	pd.testing.assert_frame_equal(get_price_data(tickers, start, end), first)
@@ -4,18 +4,13 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.data import get_price_data
 from src.stats import hedge_ratio
 from src.backtest import backtest_pair
 
 
 @pytest.mark.slow
-def test_pl_and_hedge_integration(internet_and_yfinance: bool) -> None:
-	# Attempt download; skip cleanly on failure
-	try:
-		px = get_price_data(["KO", "PEP"], start="2018-01-01", end="2024-12-31")
-	except Exception as e:
-		pytest.skip(f"Download failed: {e}")
+def test_pl_and_hedge_integration(ko_pep_prices: pd.DataFrame) -> None:
+	px = ko_pep_prices
 
 	# Data integrity
 	assert {"KO", "PEP"}.issubset(px.columns)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.signals as signals
+from src.signals import _positions, _positions_loop, _positions_simple, generate_positions, zscore
+
+
+def test_zscore_matches_pandas_rolling(monkeypatch) -> None:
+	rng = np.random.default_rng(7)
+	s = pd.Series(50.0 + np.cumsum(rng.standard_normal(400)))
+	s.iloc[[10, 200, 201]] = np.nan
+	# Flat stretch: constant windows have zero std, so z is NaN there
+	s.iloc[250:320] = s.iloc[249]
+
+	z = zscore(s, lookback=30)
+	roll = s.rolling(30, min_periods=30)
+	expected = (s - roll.mean()) / roll.std(ddof=1)
+	pd.testing.assert_series_equal(z, expected, rtol=1e-8)
+	# float32 storage takes the NumPy cumulative-sum path
+	z32 = zscore(s, lookback=30, dtype=np.float32)
+	assert z32.dtype == np.float32
+	np.testing.assert_allclose(z32.to_numpy(), expected.to_numpy(), atol=1e-3)
+	# float64 without numba also takes the NumPy path
+	monkeypatch.setattr(signals, "NUMBA_AVAILABLE", False)
+	pd.testing.assert_series_equal(zscore(s, lookback=30), expected, rtol=1e-8)
+
+
+def test_generate_positions_state_machine() -> None:
+	# cross, enter next bar, hold (incl. NaN), exit, cross, enter, stop
+	z = pd.Series([0.0, 2.1, 1.5, np.nan, 1.0, 0.3, -2.5, -2.0, -4.0, 0.0])
+	y_pos, x_pos = generate_positions(z, beta=2.0, z_in=2.0, z_out=0.5, stop=3.5)
+
+	expected = [0, 0, -1, -1, -1, 0, 0, 1, 0, 0]
+	assert y_pos.tolist() == expected
+	assert y_pos.dtype == np.float64
+	assert (x_pos == 2.0 * y_pos).all()
+
+
+def test_generate_positions_confirm_and_take_profit() -> None:
+	z = pd.Series([2.6, 2.8, 2.5, 2.0, 1.0, 0.05])
+	# Entry waits until z has reverted by 0.5 from the cross level
+	y_pos, _ = generate_positions(z, beta=1.0, z_in=2.0, z_out=0.0, stop=5.0, confirm_delta=0.5)
+	assert y_pos.tolist() == [0, 0, 0, -1, -1, -1]
+
+	y_pos, _ = generate_positions(
+		z, beta=1.0, z_in=2.0, z_out=0.0, stop=5.0, tp_threshold=0.1, confirm_delta=0.5
+	)
+	assert y_pos.tolist() == [0, 0, 0, -1, -1, 0]
+
+
+def test_vectorized_positions_match_state_machine() -> None:
+	rng = np.random.default_rng(17)
+	for _ in range(50):
+		n = int(rng.integers(1, 300))
+		z = np.cumsum(rng.standard_normal(n)) * rng.uniform(0.2, 1.5)
+		z[rng.random(n) < 0.1] = np.nan
+		expected = _positions_loop(z, 1.5, 0.3, 3.0, np.nan, 0.0, False)
+		np.testing.assert_array_equal(_positions_simple(z, 1.5, 0.3, 3.0), expected)
+
+
+def test_compiled_positions_match_state_machine() -> None:
+	pytest.importorskip("src._signals_c")
+	rng = np.random.default_rng(23)
+	settings = [
+		(np.nan, 0.0, False),  # defaults
+		(np.nan, 0.4, False),  # confirmation
+		(0.2, 0.0, True),  # take-profit
+		(0.2, 0.4, True),
+	]
+	for _ in range(20):
+		n = int(rng.integers(1, 300))
+		z = np.cumsum(rng.standard_normal(n)) * rng.uniform(0.2, 1.5)
+		z[rng.random(n) < 0.1] = np.nan
+		for tp, confirm, tp_enabled in settings:
+			expected = _positions_loop(z, 1.5, 0.3, 3.0, tp, confirm, tp_enabled)
+			state = _positions(z, 1.5, 0.3, 3.0, tp, confirm, tp_enabled)
+			np.testing.assert_array_equal(state, expected)
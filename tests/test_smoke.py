@@ -2,15 +2,14 @@ from __future__ import annotations
 
 import pandas as pd
 
-from src.data import get_price_data
 from src.stats import hedge_ratio, adf_pvalue, half_life
 from src.backtest import backtest_pair
 from src.eval import metrics
 
 
-def test_end_to_end_smoke() -> None:
+def test_end_to_end_smoke(ko_pep_prices: pd.DataFrame) -> None:
     pairs = ("KO", "PEP")
-    px = get_price_data(list(pairs), start="2018-01-01", end="2025-01-01")
+    px = ko_pep_prices
     assert not px.empty and all(t in px.columns for t in pairs)
 
     beta = hedge_ratio(px[pairs[1]], px[pairs[0]])
@@ -35,3 +34,14 @@ def test_end_to_end_smoke() -> None:
     assert isinstance(m["sharpe"], float)
 
 
+def test_arrow_backed_prices_match_numpy(ko_pep_prices: pd.DataFrame) -> None:
+    px = ko_pep_prices.copy()
+    px.iloc[10:12, 0] = float("nan")
+    arrow = px.convert_dtypes(dtype_backend="pyarrow")
+
+    beta = hedge_ratio(px["PEP"], px["KO"])
+    assert hedge_ratio(arrow["PEP"], arrow["KO"]) == beta
+    params = {"lookback": 60, "z_in": 2.0, "z_out": 0.5, "stop": 3.5, "cost_bps": 2.0}
+    expected = backtest_pair(px["KO"], px["PEP"], beta, params)
+    pd.testing.assert_frame_equal(backtest_pair(arrow["KO"], arrow["PEP"], beta, params), expected)
+    assert metrics(expected["ret"].convert_dtypes(dtype_backend="pyarrow")) == metrics(expected["ret"])
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from statsmodels.regression.linear_model import OLS
+from statsmodels.tools.tools import add_constant
+from statsmodels.tsa.stattools import adfuller
+
+from src.stats import adf_pvalue, adf_pvalue_fast, half_life, hedge_ratio
+
+
+def test_closed_form_estimates_match_statsmodels() -> None:
+	rng = np.random.default_rng(3)
+	n = 500
+	x = pd.Series(100 + np.cumsum(rng.standard_normal(n)))
+	spread = np.zeros(n)
+	for t in range(1, n):
+		spread[t] = 0.9 * spread[t - 1] + rng.standard_normal()
+	y = 1.5 * x + spread
+
+	expected_beta = OLS(y.values, x.values).fit().params[0]
+	assert np.isclose(hedge_ratio(y, x), expected_beta, rtol=1e-10)
+
+	s = pd.Series(spread)
+	phi = OLS(np.diff(spread), add_constant(spread[:-1])).fit().params[1]
+	expected_hl = np.log(2.0) / -np.log1p(phi)
+	assert np.isclose(half_life(s), expected_hl, rtol=1e-8)
+
+
+def test_adf_pvalue_memoized_and_fixed_lag() -> None:
+	rng = np.random.default_rng(5)
+	s = pd.Series(np.cumsum(rng.standard_normal(300)))
+
+	p = adf_pvalue(s)
+	assert p == adfuller(s.values, autolag="AIC")[1]
+	# Same contents under a different index hit the cache
+	assert adf_pvalue(s.set_axis(s.index + 10)) == p
+
+	assert adf_pvalue_fast(s, maxlag=1) == adfuller(s.values, maxlag=1, autolag=None)[1]